@@ -6,17 +6,27 @@ Gradio-based management console for the Image Generation Server.
 from __future__ import annotations
 
 import ast
+import asyncio
 import functools
 import json
 import os
 import shutil
+import tempfile
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Set
+from stat import S_IMODE
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional, Any, Set
 
 import gradio as gr
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional speedup for workflow JSON; stdlib json is used otherwise
+    orjson = None
+
 CONFIG_PATH = "config.json"
 STYLES_PATH = os.path.join("data", "styles.json")
 PREFERENCES_PATH = os.path.join("data", "user_preferences.json")
@@ -28,6 +38,10 @@ WORKFLOW_ORIGINALS_DIR = os.path.join(WORKFLOW_DIR, "originals")
 MAX_WORKFLOW_FIELDS = 80
 DATA_DIR = "data"
 FLASK_PORT = 4000
+# Queue concurrency for the async workflow upload/delete/save events only, so those can overlap
+# across sessions. Everything else keeps Gradio's default of 1: the sync handlers read-modify-write
+# shared caches and settings files without locking.
+EVENT_CONCURRENCY_LIMIT = 4
 
 FIELD_KEY_SEPARATOR = "|"
 FIELD_ORDER_SEPARATOR = "!"
@@ -77,6 +91,32 @@ PLACEHOLDER_FORM_HINTS: Dict[str, Dict[str, Any]] = {
 }
 
 PLACEHOLDER_MAX_FIELDS = 40
+PLACEHOLDER_ROW_COMPONENTS = 5  # label, text, number, checkbox, dropdown
+
+# Shared hide-updates for unused placeholder rows; these carry no value and are never mutated.
+_HIDDEN_PLACEHOLDER_ROW_UPDATES = tuple(gr.update(visible=False) for _ in range(PLACEHOLDER_ROW_COMPONENTS))
+# No-op updates for the whole placeholder dashboard: state, status, then every row component.
+_UNCHANGED_PLACEHOLDER_DASHBOARD = tuple(
+    gr.update() for _ in range(2 + PLACEHOLDER_MAX_FIELDS * PLACEHOLDER_ROW_COMPONENTS)
+)
+
+# Client-side confirm hooks for destructive actions, built once at import.
+RESTORE_WORKFLOW_CONFIRM_JS = (
+    "(state) => ({state, confirmed: confirm('Restore original workflow? This overwrites current edits.')})"
+)
+DELETE_PLACEHOLDER_CONFIRM_JS = (
+    "(name, state, flag, dashboard) => [name, state, confirm(`Delete placeholder '${name}'?`), dashboard]"
+)
+DELETE_WORKFLOW_CONFIRM_JS = """
+(selected, editorValue, dashboardValue, configState, dashboardForm) => {
+    if (!selected) {
+        alert('Select a workflow to delete.');
+        return [null, editorValue, dashboardValue, configState, dashboardForm];
+    }
+    const ok = confirm(`Delete workflow '${selected}'? This will remove associated files.`);
+    return [ok ? selected : null, editorValue, dashboardValue, configState, dashboardForm];
+}
+""".strip()
 
 OBJECT_INFO_CACHE: Dict[str, Any] = {}
 OBJECT_INFO_TIMESTAMP: float = 0.0
@@ -88,10 +128,37 @@ _CONFIG_CACHE: Optional[Dict] = None
 _CONFIG_CACHE_TIME: float = 0.0
 _STYLES_CACHE: Optional[Dict[str, Dict[str, str]]] = None
 _STYLES_CACHE_TIME: float = 0.0
+# (styles dict the table was built from, table rows)
+_STYLES_TABLE_CACHE: Optional[Tuple[Dict[str, Dict[str, str]], List[List[str]]]] = None
 _PREFS_CACHE: Optional[Dict] = None
 _PREFS_CACHE_TIME: float = 0.0
 _CACHE_TTL: float = 30.0  # Cache for 30 seconds
 
+# Background workflow parses started while the interface is being built
+_PRELOADED_CONFIGURATIONS: Dict[str, Tuple[Tuple[Tuple[int, int], ...], Future]] = {}
+_PRELOAD_MAX_WORKERS = 4
+
+# Directory mtimes can be coarse, so the cached listing also expires after a short TTL.
+_WORKFLOW_FILES_CACHE_TTL: float = 2.0
+_WORKFLOW_FILES_CACHE: Dict[str, Any] = {"mtime": None, "value": None, "ts": 0.0}
+
+# Shared read-only fallback for missing/invalid gr.State payloads.
+_EMPTY_STATE: Mapping[str, Any] = MappingProxyType({"filename": None, "fields": []})
+
+
+def json_loads(content: Any) -> Any:
+    """Parse JSON text, using orjson when available (its errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps_pretty(data: Any) -> str:
+    """Serialize JSON with two-space indentation, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
 
 def dedupe_and_sort_strings(items: List[str]) -> List[str]:
     """Utility function to deduplicate and sort strings efficiently."""
@@ -105,6 +172,11 @@ def safe_dict_copy(item: Any) -> Dict[str, Any]:
     return dict(item) if isinstance(item, dict) else {}
 
 
+def _coerce_state(state: Any) -> Mapping[str, Any]:
+    """Return a state payload as a mapping, falling back to the shared empty state."""
+    return state if isinstance(state, dict) else _EMPTY_STATE
+
+
 def get_file_mtime(path: str) -> float:
     """Get file modification time safely."""
     try:
@@ -113,6 +185,18 @@ def get_file_mtime(path: str) -> float:
         return 0.0
 
 
+def get_file_signature(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, or (0, -1) if it is missing, for use as a cache key.
+
+    The size catches rewrites within one tick of a coarse mtime (2 s on FAT).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0, -1
+    return stat.st_mtime_ns, stat.st_size
+
+
 def load_config() -> Dict:
     """Load server configuration with caching, falling back to sensible defaults."""
     global _CONFIG_CACHE, _CONFIG_CACHE_TIME
@@ -192,6 +276,7 @@ def save_styles(styles: Dict[str, Dict[str, str]]) -> bool:
         with open(STYLES_PATH, "w", encoding="utf-8") as fh:
             json.dump(styles, fh, indent=2)
         _STYLES_CACHE = None  # Invalidate cache
+        clear_styles_table_cache()
         return True
     except OSError:
         return False
@@ -257,15 +342,67 @@ def save_user_preferences(prefs: Dict) -> bool:
 
 
 def get_workflow_files() -> List[str]:
-    if not os.path.exists(WORKFLOW_DIR):
+    """List workflow JSON files; the scan is reused while the directory mtime holds, for a short TTL."""
+    try:
+        mtime_ns = os.stat(WORKFLOW_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted([f for f in os.listdir(WORKFLOW_DIR) if f.endswith(".json")])
+    now = time.monotonic()
+    cached = _WORKFLOW_FILES_CACHE.get("value")
+    if (
+        cached is not None
+        and _WORKFLOW_FILES_CACHE.get("mtime") == mtime_ns
+        and now - _WORKFLOW_FILES_CACHE.get("ts", 0.0) < _WORKFLOW_FILES_CACHE_TTL
+    ):
+        return list(cached)
+    # scandir's entries carry the file type from the directory read, so is_file() needs no extra stat.
+    with os.scandir(WORKFLOW_DIR) as entries:
+        files = sorted(entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file())
+    _WORKFLOW_FILES_CACHE.update({"mtime": mtime_ns, "value": files, "ts": now})
+    return list(files)
+
+
+def clear_workflow_files_cache() -> None:
+    _WORKFLOW_FILES_CACHE.update({"mtime": None, "value": None, "ts": 0.0})
 
 
 def ensure_directory(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def read_text_file(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+def _make_sibling_temp(path: str) -> Tuple[int, str]:
+    """Create a uniquely named temp file next to `path`, so concurrent writers never share one."""
+    return tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=os.path.basename(path), suffix=".tmp"
+    )
+
+
+def write_text_atomic(path: str, content: str) -> None:
+    """Write text to a sibling temp file in a single call, then atomically move it into place."""
+    fd, tmp_path = _make_sibling_temp(path)
+    try:
+        with open(fd, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        # mkstemp creates the file 0600; keep the permissions an ordinary write would have had.
+        try:
+            mode = S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def workflow_settings_path(filename: str) -> str:
     stem = os.path.splitext(filename)[0]
     return os.path.join(WORKFLOW_SETTINGS_DIR, f"{stem}-settings.json")
@@ -275,14 +412,33 @@ def workflow_original_path(filename: str) -> str:
     return os.path.join(WORKFLOW_ORIGINALS_DIR, filename)
 
 
+def copy_file_atomic(source: str, destination: str) -> None:
+    """Copy `source` to a sibling temp file of `destination`, then atomically move it into place.
+
+    Always a real copy, so a workflow restored from its original never shares the backup's inode.
+    """
+    fd, tmp_path = _make_sibling_temp(destination)
+    os.close(fd)
+    try:
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, destination)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def ensure_workflow_original(filename: str, content: str) -> None:
     if not filename:
         return
     ensure_directory(WORKFLOW_ORIGINALS_DIR)
     target = workflow_original_path(filename)
-    if not os.path.exists(target):
-        with open(target, "w", encoding="utf-8") as fh:
-            fh.write(content)
+    if os.path.exists(target):
+        return
+    # Always a real copy: a backup sharing the live file's inode would follow any in-place edit.
+    write_text_atomic(target, content)
 
 
 def load_workflow_settings_full(filename: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -306,16 +462,51 @@ def save_workflow_settings_full(filename: str, placeholders_map: Dict[str, Any],
     ensure_directory(WORKFLOW_SETTINGS_DIR)
     payload = dict(placeholders_map)
     payload["__fields"] = field_map
-    with open(workflow_settings_path(filename), "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2)
+    # Atomic, so a concurrent load never sees a truncated file and falls back to empty settings.
+    write_text_atomic(workflow_settings_path(filename), json.dumps(payload, indent=2))
 
 
-def load_workflow_file(filename: str) -> Tuple[Dict[str, Any], str]:
-    path = os.path.join(WORKFLOW_DIR, filename)
+_WORKFLOW_LOCKS: Dict[Optional[str], asyncio.Lock] = {}
+
+
+def workflow_lock(filename: Optional[str]) -> asyncio.Lock:
+    """Per-workflow lock for the async handlers' read-modify-write of a workflow and its settings.
+
+    Only called from the event loop, so creating the lock on first use needs no guard.
+    """
+    lock = _WORKFLOW_LOCKS.get(filename)
+    if lock is None:
+        lock = _WORKFLOW_LOCKS[filename] = asyncio.Lock()
+    return lock
+
+
+@functools.lru_cache(maxsize=32)
+def _read_workflow_json(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    """Parse a workflow file; cached per (path, mtime, size) so unchanged files are parsed once."""
     with open(path, "r", encoding="utf-8") as fh:
         content = fh.read()
-    data = json.loads(content)
-    return data, content
+    return json_loads(content), content
+
+
+def read_workflow_file(filename: str) -> Tuple[Dict[str, Any], str]:
+    """Return the cached parse of a workflow. The dict is shared and must not be mutated."""
+    path = os.path.join(WORKFLOW_DIR, filename)
+    stat = os.stat(path)
+    return _read_workflow_json(path, stat.st_mtime_ns, stat.st_size)
+
+
+def editable_workflow_copy(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a workflow deep enough that node inputs can be modified without touching the original."""
+    return {
+        node_id: dict(node, inputs=dict(node.get("inputs", {}))) if isinstance(node, dict) else node
+        for node_id, node in data.items()
+    }
+
+
+def load_workflow_file(filename: str) -> Tuple[Dict[str, Any], str]:
+    """Return an editable copy of a workflow (node inputs may be modified) and its raw text."""
+    data, content = read_workflow_file(filename)
+    return editable_workflow_copy(data), content
 
 
 def comfyui_base_url(cfg: Optional[Dict] = None) -> str:
@@ -472,13 +663,13 @@ def remove_associated_workflow_files(filename: str) -> List[str]:
     targets.append(os.path.join(WORKFLOW_SETTINGS_DIR, filename))
     targets.append(os.path.join(WORKFLOW_SETTINGS_DIR, f"{stem}-settings.json"))
 
-    for path in targets:
-        if path and os.path.isfile(path):
-            try:
-                os.remove(path)
-                removed.append(path)
-            except OSError:
-                pass
+    # One unlink per distinct path; missing files simply fail with FileNotFoundError.
+    for path in dict.fromkeys(targets):
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError:
+            pass
 
     return removed
 
@@ -523,6 +714,17 @@ def find_field_value(
     return None, None
 
 
+def index_field_map(field_map: Dict[str, Any]) -> Dict[Tuple[str, str], Any]:
+    """Index stored field values by (node_id, input_name); first match wins, like find_field_value."""
+    index: Dict[Tuple[str, str], Any] = {}
+    for key, value in field_map.items():
+        _, node_id, input_name = parse_field_storage_key(key)
+        if node_id is None or input_name is None:
+            continue
+        index.setdefault((node_id, input_name), value)
+    return index
+
+
 def convert_string_to_type(value: str, type_name: str) -> Tuple[Optional[Any], Optional[str]]:
     if type_name == "int":
         try:
@@ -542,10 +744,32 @@ def parse_workflow_for_configuration(filename: str) -> Tuple[List[Dict[str, Any]
     if not filename:
         return [], {}
 
-    workflow_data, raw_content = load_workflow_file(filename)
+    cached_fields, workflow_data, raw_content = _parse_workflow_for_configuration_cached(
+        filename, _configuration_source_signature(filename)
+    )
+    # Only an explicit load creates the backup; the cached parse itself stays read-only.
     ensure_workflow_original(filename, raw_content)
+    # Rows are handed to callers that edit them; the cached tuple itself stays untouched.
+    return [dict(field) for field in cached_fields], workflow_data
+
 
+@functools.lru_cache(maxsize=64)
+def _parse_workflow_for_configuration_cached(
+    filename: str, signature: Tuple[Tuple[int, int], ...]
+) -> Tuple[Tuple[Dict[str, Any], ...], Dict[str, Any], str]:
+    """Parse a workflow for configuration; cached per source-file signature so re-selecting it is free."""
+    workflow_data, raw_content = read_workflow_file(filename)
     placeholder_defaults, field_defaults_raw = load_workflow_settings_full(filename)
+    fields = build_configuration_fields(workflow_data, placeholder_defaults, field_defaults_raw)
+    return tuple(fields), workflow_data, raw_content
+
+
+def build_configuration_fields(
+    workflow_data: Dict[str, Any],
+    placeholder_defaults: Dict[str, Any],
+    field_defaults_raw: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Build configuration rows from in-memory workflow data and its stored settings."""
     placeholders = load_placeholders()
     placeholder_set = set(placeholders)
 
@@ -626,7 +850,7 @@ def parse_workflow_for_configuration(filename: str) -> Tuple[List[Dict[str, Any]
             sequence += 1
 
     if not node_entries:
-        return [], workflow_data
+        return []
 
     for idx, entry in enumerate(node_entries, start=1):
         entry["order"] = normalize_field_order(entry.get("order"), idx)
@@ -650,7 +874,46 @@ def parse_workflow_for_configuration(filename: str) -> Tuple[List[Dict[str, Any]
             field_copy["display_node_title"] = node_title if is_primary else ""
             fields.append(field_copy)
 
-    return fields, workflow_data
+    return fields
+
+
+def _configuration_source_signature(filename: str) -> Tuple[Tuple[int, int], ...]:
+    """(mtime_ns, size) of every file parse_workflow_for_configuration reads."""
+    return (
+        get_file_signature(os.path.join(WORKFLOW_DIR, filename)),
+        get_file_signature(workflow_settings_path(filename)),
+        get_file_signature(PLACEHOLDERS_PATH),
+    )
+
+
+def preload_workflow_configurations(filenames: List[str]) -> None:
+    """Start parsing workflows in background threads so the first load is served from memory.
+
+    Read-only: this only warms the parse cache and writes nothing to disk.
+    """
+    if not filenames:
+        return
+    executor = ThreadPoolExecutor(max_workers=_PRELOAD_MAX_WORKERS)
+    for filename in filenames:
+        signature = _configuration_source_signature(filename)
+        _PRELOADED_CONFIGURATIONS[filename] = (
+            signature,
+            executor.submit(_parse_workflow_for_configuration_cached, filename, signature),
+        )
+    executor.shutdown(wait=False)
+
+
+def load_workflow_configuration_fields(filename: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Return a preloaded parse when its source files are unchanged, otherwise parse now."""
+    entry = _PRELOADED_CONFIGURATIONS.pop(filename, None)
+    if entry is not None:
+        signature, future = entry
+        if signature == _configuration_source_signature(filename):
+            # Wait for the background parse; the call below is then a cache hit.
+            future.result()
+        else:
+            future.cancel()
+    return parse_workflow_for_configuration(filename)
 
 
 def _sanitize_string_list(items: Any) -> List[str]:
@@ -997,75 +1260,66 @@ def format_placeholder_label(field: Dict[str, Any]) -> str:
 
 def build_placeholder_form_updates(fields: List[Dict[str, Any]]) -> List[Any]:
     updates: List[Any] = []
-    for idx in range(PLACEHOLDER_MAX_FIELDS):
-        if idx < len(fields):
-            field = fields[idx]
-            component = field.get("component")
-            updates.append(
-                gr.update(value=format_placeholder_label(field), visible=True)
-            )
+    visible_fields = fields[:PLACEHOLDER_MAX_FIELDS]
+    for field in visible_fields:
+        component = field.get("component")
+        updates.append(
+            gr.update(value=format_placeholder_label(field), visible=True)
+        )
 
-            if component in {"text", "textarea"}:
-                updates.append(
-                    gr.update(
-                        value=field.get("value", ""),
-                        visible=True,
-                        lines=int(field.get("lines", 1)),
-                        interactive=True,
-                    )
+        if component in {"text", "textarea"}:
+            updates.append(
+                gr.update(
+                    value=field.get("value", ""),
+                    visible=True,
+                    lines=int(field.get("lines", 1)),
+                    interactive=True,
                 )
-            else:
-                updates.append(gr.update(visible=False))
+            )
+        else:
+            updates.append(gr.update(visible=False))
 
-            if component in {"int", "float"}:
-                precision = 0 if component == "int" else field.get("precision") or 3
-                updates.append(
-                    gr.update(
-                        value=field.get("value"),
-                        visible=True,
-                        interactive=True,
-                        precision=precision,
-                        minimum=field.get("min"),
-                        maximum=field.get("max"),
-                        step=field.get("step"),
-                    )
+        if component in {"int", "float"}:
+            precision = 0 if component == "int" else field.get("precision") or 3
+            updates.append(
+                gr.update(
+                    value=field.get("value"),
+                    visible=True,
+                    interactive=True,
+                    precision=precision,
+                    minimum=field.get("min"),
+                    maximum=field.get("max"),
+                    step=field.get("step"),
                 )
-            else:
-                updates.append(gr.update(visible=False))
+            )
+        else:
+            updates.append(gr.update(visible=False))
 
-            if component == "checkbox":
-                updates.append(
-                    gr.update(
-                        value=bool(field.get("value")),
-                        visible=True,
-                        interactive=True,
-                    )
+        if component == "checkbox":
+            updates.append(
+                gr.update(
+                    value=bool(field.get("value")),
+                    visible=True,
+                    interactive=True,
                 )
-            else:
-                updates.append(gr.update(visible=False))
+            )
+        else:
+            updates.append(gr.update(visible=False))
 
-            if component == "dropdown":
-                updates.append(
-                    gr.update(
-                        value=field.get("value", ""),
-                        choices=field.get("options") or [],
-                        visible=True,
-                        interactive=True,
-                        allow_custom_value=bool(field.get("allow_custom")),
-                    )
+        if component == "dropdown":
+            updates.append(
+                gr.update(
+                    value=field.get("value", ""),
+                    choices=field.get("options") or [],
+                    visible=True,
+                    interactive=True,
+                    allow_custom_value=bool(field.get("allow_custom")),
                 )
-            else:
-                updates.append(gr.update(visible=False))
-        else:
-            updates.extend(
-                [
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                ]
             )
+        else:
+            updates.append(gr.update(visible=False))
+
+    updates.extend(_HIDDEN_PLACEHOLDER_ROW_UPDATES * (PLACEHOLDER_MAX_FIELDS - len(visible_fields)))
     return updates
 
 
@@ -1204,13 +1458,15 @@ def apply_fields_to_workflow(
     active_placeholders: Set[str] = set()
 
     for idx, field in enumerate(fields):
-        node = workflow_data.get(field["node_id"])
+        node_id = field["node_id"]
+        node = workflow_data.get(node_id)
         if not node:
             continue
         inputs = node.setdefault("inputs", {})
+        input_name = field["input_name"]
         order_value = normalize_field_order(field.get("order"), idx + 1)
         field["order"] = order_value
-        field_key = workflow_field_key(field["node_id"], field["input_name"], order_value)
+        field_key = workflow_field_key(node_id, input_name, order_value)
         placeholder = field.get("placeholder", "")
         value_type = field.get("type", "str")
 
@@ -1220,18 +1476,21 @@ def apply_fields_to_workflow(
             placeholder_value: Optional[Any]
             err: Optional[str] = None
 
-            if isinstance(stored_raw, str) and stored_raw.strip().startswith("%") and stored_raw.strip().endswith("%"):
-                placeholder_value = None
-            elif stored_raw in (None, ""):
+            if stored_raw in (None, ""):
                 placeholder_value = None
             else:
-                placeholder_value, err = convert_string_to_type(str(stored_raw), value_type)
+                stored_text = str(stored_raw)
+                stripped = stored_text.strip()
+                if isinstance(stored_raw, str) and stripped.startswith("%") and stripped.endswith("%"):
+                    placeholder_value = None
+                else:
+                    placeholder_value, err = convert_string_to_type(stored_text, value_type)
 
             if err:
-                errors.append(f"{field['node_title']} → {field['input_name']}: {err}")
+                errors.append(f"{field['node_title']} → {input_name}: {err}")
                 continue
 
-            inputs[field["input_name"]] = f"%{placeholder}%"
+            inputs[input_name] = f"%{placeholder}%"
             if placeholder_value is not None:
                 placeholders_map[placeholder] = placeholder_value
                 field_map[field_key] = placeholder_value
@@ -1239,14 +1498,74 @@ def apply_fields_to_workflow(
             text_value = field.get("text_value", "")
             typed_value, err = convert_string_to_type(text_value, value_type)
             if err:
-                errors.append(f"{field['node_title']} → {field['input_name']}: {err}")
+                errors.append(f"{field['node_title']} → {input_name}: {err}")
                 continue
-            inputs[field["input_name"]] = typed_value
+            inputs[input_name] = typed_value
             field_map[field_key] = typed_value
 
     return errors, placeholders_map, field_map, workflow_data, active_placeholders
 
 
+def merge_active_placeholders(
+    existing_placeholders: Any,
+    new_placeholders: Dict[str, Any],
+    active_placeholders: Iterable[str],
+) -> Dict[str, Any]:
+    """Keep stored defaults for placeholders still in use, then overlay the new ones."""
+    if not isinstance(active_placeholders, (set, frozenset)):
+        active_placeholders = set(active_placeholders)
+    final_placeholders: Dict[str, Any] = {}
+    if isinstance(existing_placeholders, dict):
+        final_placeholders = {
+            key: value
+            for key, value in existing_placeholders.items()
+            if key in active_placeholders
+        }
+    final_placeholders.update(new_placeholders)
+    return final_placeholders
+
+
+def _resolve_field_value(
+    field: Dict[str, Any],
+    key: str,
+    new_field_map: Dict[str, Any],
+    existing_lookup: Dict[Tuple[str, str], Any],
+    final_placeholders: Dict[str, Any],
+) -> Any:
+    if key in new_field_map:
+        return new_field_map[key]
+    existing_value = existing_lookup.get((field.get("node_id"), field.get("input_name")))
+    if existing_value is not None:
+        return existing_value
+    placeholder_name = field.get("placeholder", "")
+    if placeholder_name:
+        return final_placeholders.get(placeholder_name)
+    value, _ = convert_string_to_type(str(field.get("text_value", "")), field.get("type", "str"))
+    return value
+
+
+def resolve_final_field_map(
+    fields: List[Dict[str, Any]],
+    new_field_map: Dict[str, Any],
+    existing_field_map: Any,
+    final_placeholders: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Resolve each field's stored value: applied value, prior stored value, placeholder default, typed text."""
+    existing_lookup = index_field_map(existing_field_map if isinstance(existing_field_map, dict) else {})
+    keys = [
+        workflow_field_key(
+            field.get("node_id"),
+            field.get("input_name"),
+            normalize_field_order(field.get("order"), idx + 1),
+        )
+        for idx, field in enumerate(fields)
+    ]
+    return {
+        key: _resolve_field_value(field, key, new_field_map, existing_lookup, final_placeholders)
+        for key, field in zip(keys, fields)
+    }
+
+
 def update_field_value(fields: List[Dict[str, Any]], index: int, new_value: str) -> List[Dict[str, Any]]:
     if not (0 <= index < len(fields)):
         return fields
@@ -1293,7 +1612,7 @@ def update_placeholder_field_value(
     if not (0 <= index < len(fields)):
         return fields
 
-    updated_fields = [dict(item) for item in fields]
+    updated_fields = list(fields)
     field = dict(updated_fields[index])
     field["value"] = new_value
 
@@ -1326,12 +1645,12 @@ def update_field_order(
 ) -> List[Dict[str, Any]]:
     if not (0 <= index < len(fields)):
         return fields
-    updated_fields = [dict(item) for item in fields]
-    target_field = dict(updated_fields[index])
-    target_node = target_field.get("node_id")
+    # Only rows belonging to the edited node change; the rest are shared with the old list.
+    updated_fields = list(fields)
+    target_node = fields[index].get("node_id")
     new_order = normalize_field_order(new_value, index + 1)
 
-    for idx, item in enumerate(updated_fields):
+    for idx, item in enumerate(fields):
         if item.get("node_id") != target_node:
             continue
         item_copy = dict(item)
@@ -1524,16 +1843,30 @@ def load_workflow_content(filename: str) -> Tuple[str, str]:
         return "", "No workflow selected"
     path = os.path.join(WORKFLOW_DIR, filename)
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            content = fh.read()
+        stat = os.stat(path)
+        return _load_workflow_content_cached(
+            path, stat.st_mtime_ns, stat.st_size, get_file_signature(PLACEHOLDERS_PATH)
+        )
     except OSError as exc:
         return "", f"Failed to read workflow: {exc}"
+
+
+@functools.lru_cache(maxsize=64)
+def _load_workflow_content_cached(
+    path: str, mtime_ns: int, size: int, placeholders_signature: Tuple[int, int]
+) -> Tuple[str, str]:
+    """Read a workflow and summarize its placeholders; cached per file and placeholder-list signature."""
+    content = read_text_file(path)
+    return content, summarize_workflow_placeholders(content)
+
+
+def summarize_workflow_placeholders(content: str) -> str:
     placeholders = detect_workflow_placeholders(content)
     summary_lines = ["### Placeholders Detected"]
     summary_lines.extend(
         [f"- `{name}`: {'✅' if present else '⬜️'}" for name, present in placeholders.items()]
     )
-    return content, "\n".join(summary_lines)
+    return "\n".join(summary_lines)
 
 
 def save_workflow_content(filename: str, content: str) -> Tuple[bool, str]:
@@ -1545,8 +1878,7 @@ def save_workflow_content(filename: str, content: str) -> Tuple[bool, str]:
     except json.JSONDecodeError as exc:
         return False, f"Invalid JSON: {exc}"
     try:
-        with open(path, "w", encoding="utf-8") as fh:
-            fh.write(content)
+        write_text_atomic(path, content)
         return True, f"Saved {filename}"
     except OSError as exc:
         return False, f"Failed to save workflow: {exc}"
@@ -1730,12 +2062,43 @@ def reset_styles_preview(style_name: str) -> str:
     return build_style_preview(style_name)
 
 
+def clear_styles_table_cache() -> None:
+    global _STYLES_TABLE_CACHE
+    _STYLES_TABLE_CACHE = None
+
+
 def styles_as_table() -> List[List[str]]:
+    """Rows for the styles table; rebuilt only when the loaded styles change."""
+    global _STYLES_TABLE_CACHE
     styles = load_styles()
-    table = [["style", "pre", "post"]]
-    for name, info in styles.items():
-        table.append([name, info.get("pre", ""), info.get("post", "")])
-    return table[1:]
+    if _STYLES_TABLE_CACHE is not None and _STYLES_TABLE_CACHE[0] is styles:
+        return _STYLES_TABLE_CACHE[1]
+    table = [[name, info.get("pre", ""), info.get("post", "")] for name, info in styles.items()]
+    _STYLES_TABLE_CACHE = (styles, table)
+    return table
+
+
+# The style edits mutate the cached styles dict in place before saving, so a failed save leaves
+# its identity unchanged; drop the table explicitly so it always matches the dropdowns.
+def add_style_with_table(name: str, pre: str, post: str) -> Tuple[Any, ...]:
+    """Add a style and return the refreshed styles table in the same response."""
+    result = add_style(name, pre, post)
+    clear_styles_table_cache()
+    return (*result, styles_as_table())
+
+
+def update_style_with_table(name: str, pre: str, post: str) -> Tuple[Any, ...]:
+    """Update a style and return the refreshed styles table in the same response."""
+    result = update_style(name, pre, post)
+    clear_styles_table_cache()
+    return (*result, styles_as_table())
+
+
+def delete_style_with_table(name: str) -> Tuple[Any, ...]:
+    """Delete a style and return the refreshed styles table in the same response."""
+    result = delete_style(name)
+    clear_styles_table_cache()
+    return (*result, styles_as_table())
 
 
 def save_server_configuration(
@@ -1777,24 +2140,50 @@ def load_placeholder_defaults_handler(selected: Optional[str]):
     return build_placeholder_form_response(selected, fields, notes + truncated_note)
 
 
-def make_placeholder_change_handler(index: int):
-    """Create a placeholder value change handler for a specific index."""
-    def _handler(value: Any, state: Dict[str, Any]):
-        fields = state.get("fields", []) if isinstance(state, dict) else []
-        updated = update_placeholder_field_value(fields, index, value)
-        payload = {
-            "filename": state.get("filename") if isinstance(state, dict) else None,
-            "fields": updated,
-        }
-        return payload
-    return _handler
+def placeholder_value_change_handler(index: int, value: Any, state: Dict[str, Any]):
+    """Handle a placeholder default edit; bind `index` with functools.partial."""
+    state = _coerce_state(state)
+    updated = update_placeholder_field_value(state.get("fields", []), index, value)
+    return {
+        "filename": state.get("filename"),
+        "fields": updated,
+    }
+
+
+def config_order_change_handler(index: int, new_value: Any, state: Dict[str, Any]):
+    """Handle a workflow config row order edit; bind `index` with functools.partial."""
+    state = _coerce_state(state)
+    return {
+        "filename": state.get("filename"),
+        "fields": update_field_order(state.get("fields", []), index, new_value),
+    }
+
+
+def config_value_change_handler(index: int, new_value: str, state: Dict[str, Any]):
+    """Handle a workflow config value edit; bind `index` with functools.partial."""
+    state = _coerce_state(state)
+    return {
+        "filename": state.get("filename"),
+        "fields": update_field_value(state.get("fields", []), index, new_value),
+    }
+
+
+def config_placeholder_change_handler(index: int, selection: str, state: Dict[str, Any]):
+    """Handle a workflow config placeholder selection; bind `index` with functools.partial."""
+    state = _coerce_state(state)
+    fields, value, enable_editing = update_field_placeholder(state.get("fields", []), index, selection)
+    payload = {
+        "filename": state.get("filename"),
+        "fields": fields,
+    }
+    return payload, gr.update(value=value, interactive=enable_editing, visible=True)
 
 
 def refresh_object_info_handler(force: bool, workflow_value: Optional[str], placeholder_state_value: Optional[Dict[str, Any]]):
     """Handle object info refresh."""
     target_workflow = workflow_value
-    if not target_workflow and isinstance(placeholder_state_value, dict):
-        target_workflow = placeholder_state_value.get("filename")
+    if not target_workflow:
+        target_workflow = _coerce_state(placeholder_state_value).get("filename")
 
     data, notes, timestamp = refresh_object_info(force=force)
     status = object_info_status_message(timestamp, notes)
@@ -1978,8 +2367,11 @@ def build_interface() -> gr.Blocks:
     if not workflow_files:
         workflow_warning = workflow_warning or "⚠️ No workflows found. Upload a workflow JSON to get started."
 
+    # Parse every workflow in the background while the UI is assembled
+    preload_workflow_configurations(workflow_files)
+
     # Prepare initial data for placeholders
-    initial_config_fields, _ = parse_workflow_for_configuration(active_workflow_name) if active_workflow_name else ([], {})
+    initial_config_fields, _ = load_workflow_configuration_fields(active_workflow_name) if active_workflow_name else ([], {})
     initial_placeholders = load_placeholders()
     object_info_data, object_info_notes, object_info_timestamp = refresh_object_info(force=True)
     object_info_status_initial = object_info_status_message(object_info_timestamp, object_info_notes)
@@ -2227,8 +2619,8 @@ def build_interface() -> gr.Blocks:
                         placeholder_state_value: Optional[Dict[str, Any]],
                     ):
                         target_workflow = workflow_value
-                        if not target_workflow and isinstance(placeholder_state_value, dict):
-                            target_workflow = placeholder_state_value.get("filename")
+                        if not target_workflow:
+                            target_workflow = _coerce_state(placeholder_state_value).get("filename")
 
                         data, notes, timestamp = refresh_object_info(force=force)
                         status = object_info_status_message(timestamp, notes)
@@ -2280,12 +2672,13 @@ def build_interface() -> gr.Blocks:
                     )
 
                     def reload_placeholder_defaults(state: Dict[str, Any]):
-                        filename = state.get("filename") if isinstance(state, dict) else None
+                        filename = _coerce_state(state).get("filename")
                         return load_placeholder_defaults(filename)
 
                     def save_placeholder_defaults(state: Dict[str, Any]):
-                        filename = state.get("filename") if isinstance(state, dict) else None
-                        fields = state.get("fields", []) if isinstance(state, dict) else []
+                        state = _coerce_state(state)
+                        filename = state.get("filename")
+                        fields = state.get("fields", [])
                         if not filename:
                             return build_placeholder_form_response(
                                 filename,
@@ -2344,36 +2737,24 @@ def build_interface() -> gr.Blocks:
                             messages,
                         )
 
-                    def make_placeholder_change_handler(index: int):
-                        def _handler(value: Any, state: Dict[str, Any]):
-                            fields = state.get("fields", []) if isinstance(state, dict) else []
-                            updated = update_placeholder_field_value(fields, index, value)
-                            payload = {
-                                "filename": state.get("filename") if isinstance(state, dict) else None,
-                                "fields": updated,
-                            }
-                            return payload
-
-                        return _handler
-
                     for idx in range(PLACEHOLDER_MAX_FIELDS):
                         placeholder_text_inputs[idx].change(
-                            make_placeholder_change_handler(idx),
+                            functools.partial(placeholder_value_change_handler, idx),
                             inputs=[placeholder_text_inputs[idx], placeholder_form_state],
                             outputs=placeholder_form_state,
                         )
                         placeholder_number_inputs[idx].change(
-                            make_placeholder_change_handler(idx),
+                            functools.partial(placeholder_value_change_handler, idx),
                             inputs=[placeholder_number_inputs[idx], placeholder_form_state],
                             outputs=placeholder_form_state,
                         )
                         placeholder_checkbox_inputs[idx].change(
-                            make_placeholder_change_handler(idx),
+                            functools.partial(placeholder_value_change_handler, idx),
                             inputs=[placeholder_checkbox_inputs[idx], placeholder_form_state],
                             outputs=placeholder_form_state,
                         )
                         placeholder_dropdown_inputs[idx].change(
-                            make_placeholder_change_handler(idx),
+                            functools.partial(placeholder_value_change_handler, idx),
                             inputs=[placeholder_dropdown_inputs[idx], placeholder_form_state],
                             outputs=placeholder_form_state,
                         )
@@ -2728,6 +3109,21 @@ def build_interface() -> gr.Blocks:
                                 notes + truncated_note,
                             )
 
+                        def _build_combined_response(
+                            config_state: Mapping[str, Any],
+                            dashboard_state: Mapping[str, Any],
+                            message: str,
+                            fields: Optional[List[Dict[str, Any]]] = None,
+                        ) -> List[Any]:
+                            """Build the workflow config outputs followed by the placeholder dashboard outputs."""
+                            config_fields = config_state.get("fields", []) if fields is None else fields
+                            config_response = _build_config_response(
+                                config_state.get("filename"),
+                                config_fields,
+                                message,
+                            )
+                            return config_response + _refresh_placeholder_dashboard(dashboard_state.get("filename"))
+
                         def add_placeholder_entry(
                             name: str,
                             current_delete_value: Optional[str],
@@ -2751,20 +3147,8 @@ def build_interface() -> gr.Blocks:
                                 new_input_value = ""
                                 current_delete_value = trimmed
 
-                            state_dict = state if isinstance(state, dict) else {"filename": None, "fields": []}
-                            config_response = _build_config_response(
-                                state_dict.get("filename"),
-                                state_dict.get("fields", []),
-                                message,
-                            )
-
-                            dashboard_payload = dashboard_state if isinstance(dashboard_state, dict) else {
-                                "filename": None,
-                                "fields": [],
-                            }
-                            dashboard_updates = _refresh_placeholder_dashboard(
-                                dashboard_payload.get("filename")
-                            )
+                            state_dict = _coerce_state(state)
+                            dashboard_payload = _coerce_state(dashboard_state)
 
                             delete_value = current_delete_value if current_delete_value in placeholders else (placeholders[0] if placeholders else None)
 
@@ -2773,8 +3157,7 @@ def build_interface() -> gr.Blocks:
                                 gr.update(value=placeholder_table_rows()),
                                 gr.update(choices=placeholders, value=delete_value),
                                 gr.update(value=new_input_value),
-                                *config_response,
-                                *dashboard_updates,
+                                *_build_combined_response(state_dict, dashboard_payload, message),
                             )
 
                         def delete_placeholder_entry(
@@ -2795,116 +3178,80 @@ def build_interface() -> gr.Blocks:
                                 selected_name = selection
                                 state_payload = state
 
-                            state_dict = state_payload if isinstance(state_payload, dict) else {"filename": None, "fields": []}
-                            dashboard_payload = dashboard_state if isinstance(dashboard_state, dict) else {
-                                "filename": None,
-                                "fields": [],
-                            }
+                            state_dict = _coerce_state(state_payload)
+                            dashboard_payload = _coerce_state(dashboard_state)
 
                             if not bool(confirmed):
-                                config_response = _build_config_response(
-                                    state_dict.get("filename"),
-                                    state_dict.get("fields", []),
-                                    "Placeholder deletion cancelled.",
-                                )
                                 delete_value = selection if selection in placeholders else (placeholders[0] if placeholders else None)
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
-                                )
                                 return (
                                     "Deletion cancelled.",
                                     gr.update(value=placeholder_table_rows()),
                                     gr.update(choices=placeholders, value=delete_value),
                                     gr.update(),
-                                    *config_response,
-                                    *dashboard_updates,
+                                    *_build_combined_response(
+                                        state_dict, dashboard_payload, "Placeholder deletion cancelled."
+                                    ),
                                 )
 
                             selected = (selected_name or "").strip()
                             if not selected:
-                                config_response = _build_config_response(
-                                    state_dict.get("filename"),
-                                    state_dict.get("fields", []),
-                                    "⚠️ Select a placeholder to delete.",
-                                )
-                                delete_value = placeholders[0] if placeholders else None
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
-                                )
-                                return (
-                                    "⚠️ Select a placeholder to delete.",
-                                    gr.update(value=placeholder_table_rows()),
-                                    gr.update(choices=placeholders, value=delete_value),
-                                    gr.update(),
-                                    *config_response,
-                                    *dashboard_updates,
-                                )
+                                message = "⚠️ Select a placeholder to delete."
+                            elif selected not in placeholders:
+                                message = f"⚠️ Placeholder `{selected}` not found."
+                            else:
+                                message = ""
 
-                            if selected not in placeholders:
-                                config_response = _build_config_response(
-                                    state_dict.get("filename"),
-                                    state_dict.get("fields", []),
-                                    f"⚠️ Placeholder `{selected}` not found.",
-                                )
+                            if message:
                                 delete_value = placeholders[0] if placeholders else None
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
-                                )
                                 return (
-                                    f"⚠️ Placeholder `{selected}` not found.",
+                                    message,
                                     gr.update(value=placeholder_table_rows()),
                                     gr.update(choices=placeholders, value=delete_value),
                                     gr.update(),
-                                    *config_response,
-                                    *dashboard_updates,
+                                    *_build_combined_response(state_dict, dashboard_payload, message),
                                 )
 
                             placeholders = [p for p in placeholders if p != selected]
                             save_placeholders_list(placeholders)
                             message = f"✅ Deleted `{selected}`."
 
-                            fields = state_dict.get("fields", [])
+                            # _build_config_response copies every field, so only the rows that
+                            # actually change need a copy here.
                             updated_fields: List[Dict[str, Any]] = []
-                            for field in fields:
-                                field_copy = dict(field)
-                                if field_copy.get("placeholder") == selected:
-                                    fallback = field_copy.get("stored_value", "")
-                                    field_copy["placeholder"] = ""
-                                    field_copy["text_value"] = str(fallback) if fallback is not None else ""
-                                updated_fields.append(field_copy)
+                            for field in state_dict.get("fields", []):
+                                if field.get("placeholder") == selected:
+                                    fallback = field.get("stored_value", "")
+                                    field = dict(field)
+                                    field["placeholder"] = ""
+                                    field["text_value"] = str(fallback) if fallback is not None else ""
+                                updated_fields.append(field)
 
-                            config_response = _build_config_response(
-                                state_dict.get("filename"),
-                                updated_fields,
-                                message,
-                            )
                             delete_value = placeholders[0] if placeholders else None
-                            dashboard_updates = _refresh_placeholder_dashboard(
-                                dashboard_payload.get("filename")
-                            )
 
                             return (
                                 message,
                                 gr.update(value=placeholder_table_rows()),
                                 gr.update(choices=placeholders, value=delete_value),
                                 gr.update(),
-                                *config_response,
-                                *dashboard_updates,
+                                *_build_combined_response(
+                                    state_dict, dashboard_payload, message, fields=updated_fields
+                                ),
                             )
 
                         def load_workflow_configuration(selected: str, state: Dict[str, Any]):
                             if not selected:
-                                existing_fields = state.get("fields", []) if isinstance(state, dict) else []
-                                filename = state.get("filename") if isinstance(state, dict) else None
-                                return _build_config_response(filename, existing_fields, "⚠️ Select a workflow to load.")
-                            fields, _ = parse_workflow_for_configuration(selected)
+                                state = _coerce_state(state)
+                                return _build_config_response(
+                                    state.get("filename"), state.get("fields", []), "⚠️ Select a workflow to load."
+                                )
+                            fields, _ = load_workflow_configuration_fields(selected)
                             return _build_config_response(selected, fields, f"Loaded `{selected}`." )
 
                         def cancel_workflow_configuration(state: Dict[str, Any]):
-                            filename = state.get("filename") if isinstance(state, dict) else None
+                            state = _coerce_state(state)
+                            filename = state.get("filename")
                             if not filename:
-                                existing_fields = state.get("fields", []) if isinstance(state, dict) else []
-                                return _build_config_response(filename, existing_fields, "⚠️ No workflow selected.")
+                                return _build_config_response(filename, state.get("fields", []), "⚠️ No workflow selected.")
                             fields, _ = parse_workflow_for_configuration(filename)
                             return _build_config_response(filename, fields, "Changes reverted.")
 
@@ -2916,8 +3263,7 @@ def build_interface() -> gr.Blocks:
                                 confirmed = True
                                 state = payload
 
-                            if not isinstance(state, dict):
-                                state = {"filename": None, "fields": []}
+                            state = _coerce_state(state)
 
                             if not confirmed:
                                 return _build_config_response(state.get("filename"), state.get("fields", []), "Restore cancelled.")
@@ -2928,18 +3274,20 @@ def build_interface() -> gr.Blocks:
 
                             original = workflow_original_path(filename)
                             target = os.path.join(WORKFLOW_DIR, filename)
-                            if not os.path.exists(original):
-                                return _build_config_response(filename, state.get("fields", []), "⚠️ Original copy not found.")
                             ensure_directory(WORKFLOW_DIR)
-                            shutil.copy2(original, target)
+                            try:
+                                copy_file_atomic(original, target)
+                            except FileNotFoundError:
+                                return _build_config_response(filename, state.get("fields", []), "⚠️ Original copy not found.")
                             fields, _ = parse_workflow_for_configuration(filename)
                             return _build_config_response(filename, fields, f"Restored `{filename}` from backup.")
 
-                        def save_workflow_configuration(
+                        async def save_workflow_configuration(
                             state: Dict[str, Any], dashboard_state: Optional[Dict[str, Any]] = None
                         ):
-                            filename = state.get("filename") if isinstance(state, dict) else None
-                            raw_fields = state.get("fields", []) if isinstance(state, dict) else []
+                            state = _coerce_state(state)
+                            filename = state.get("filename")
+                            raw_fields = state.get("fields", [])
                             fields: List[Dict[str, Any]] = []
                             node_orders: Dict[str, int] = {}
                             node_index = 0
@@ -2953,119 +3301,90 @@ def build_interface() -> gr.Blocks:
                                     )
                                 normalized["order"] = node_orders.get(node_id, node_index)
                                 fields.append(normalized)
-                            dashboard_payload = dashboard_state if isinstance(dashboard_state, dict) else {
-                                "filename": None,
-                                "fields": [],
-                            }
+                            dashboard_payload = _coerce_state(dashboard_state)
                             if not filename:
                                 response = _build_config_response(filename, fields, "⚠️ No workflow selected.")
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
-                                )
-                                return response + dashboard_updates
-                            try:
-                                workflow_data, _ = load_workflow_file(filename)
-                            except FileNotFoundError:
-                                response = _build_config_response(
-                                    filename, fields, f"❌ Workflow `{filename}` not found."
-                                )
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
-                                )
-                                return response + dashboard_updates
-
-                            node_order_values = [value for value in node_orders.values() if value is not None]
-                            if len(node_order_values) != len(set(node_order_values)):
+                                return response + list(_UNCHANGED_PLACEHOLDER_DASHBOARD)
+                            # Saves and uploads of the same workflow read-modify-write its files; take turns.
+                            async with workflow_lock(filename):
+                                # File I/O runs on a worker thread so concurrent saves don't hold up the event loop.
                                 try:
-                                    gr.Warning("Duplicate row numbers detected. Changes not saved.")
-                                except Exception:
-                                    pass
-                                response = _build_config_response(
-                                    filename,
-                                    fields,
-                                    "❌ Duplicate row numbers detected. Changes not saved.",
-                                )
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
+                                    workflow_data, _ = await asyncio.to_thread(load_workflow_file, filename)
+                                except FileNotFoundError:
+                                    response = _build_config_response(
+                                        filename, fields, f"❌ Workflow `{filename}` not found."
+                                    )
+                                    return response + list(_UNCHANGED_PLACEHOLDER_DASHBOARD)
+
+                                node_order_values = [value for value in node_orders.values() if value is not None]
+                                if len(node_order_values) != len(set(node_order_values)):
+                                    try:
+                                        gr.Warning("Duplicate row numbers detected. Changes not saved.")
+                                    except Exception:
+                                        pass
+                                    response = _build_config_response(
+                                        filename,
+                                        fields,
+                                        "❌ Duplicate row numbers detected. Changes not saved.",
+                                    )
+                                    return response + list(_UNCHANGED_PLACEHOLDER_DASHBOARD)
+
+                                # list.sort is stable, so plain int keys keep the original
+                                # position as the tie-breaker without building tuples.
+                                order_keys = [
+                                    FIELD_ORDER_MAX + 1
+                                    if item.get("order") is None
+                                    else normalize_field_order(item.get("order"), FIELD_ORDER_MAX + 1)
+                                    for item in fields
+                                ]
+                                sorted_indices = sorted(range(len(fields)), key=order_keys.__getitem__)
+                                sorted_fields = []
+                                for idx, field_index in enumerate(sorted_indices, start=1):
+                                    field_item = dict(fields[field_index])
+                                    field_item["order"] = normalize_field_order(field_item.get("order"), idx)
+                                    sorted_fields.append(field_item)
+                                fields = sorted_fields
+
+                                existing_placeholders_map, existing_field_map = await asyncio.to_thread(
+                                    load_workflow_settings_full, filename
                                 )
-                                return response + dashboard_updates
 
-                            indexed_fields = [
-                                (idx, dict(item)) for idx, item in enumerate(fields)
-                            ]
-                            indexed_fields.sort(
-                                key=lambda entry: (
-                                    entry[1].get("order", FIELD_ORDER_MAX + 1),
-                                    entry[0],
+                                (
+                                    errors,
+                                    new_placeholders_map,
+                                    new_field_map,
+                                    updated_workflow,
+                                    active_placeholders,
+                                ) = apply_fields_to_workflow(
+                                    filename, workflow_data, fields
                                 )
-                            )
-                            fields = []
-                            for idx, (_, field_item) in enumerate(indexed_fields, start=1):
-                                field_item["order"] = normalize_field_order(field_item.get("order"), idx)
-                                fields.append(field_item)
-
-                            existing_placeholders_map, existing_field_map = load_workflow_settings_full(filename)
-
-                            (
-                                errors,
-                                new_placeholders_map,
-                                new_field_map,
-                                updated_workflow,
-                                active_placeholders,
-                            ) = apply_fields_to_workflow(
-                                filename, workflow_data, fields
-                            )
-                            if errors:
-                                message = "❌ " + " | ".join(errors)
-                                response = _build_config_response(filename, fields, message)
-                                dashboard_updates = _refresh_placeholder_dashboard(
-                                    dashboard_payload.get("filename")
+                                if errors:
+                                    message = "❌ " + " | ".join(errors)
+                                    response = _build_config_response(filename, fields, message)
+                                    return response + list(_UNCHANGED_PLACEHOLDER_DASHBOARD)
+
+                                workflow_text = await asyncio.to_thread(json_dumps_pretty, updated_workflow)
+                                await asyncio.to_thread(ensure_directory, WORKFLOW_DIR)
+                                await asyncio.to_thread(
+                                    write_text_atomic, os.path.join(WORKFLOW_DIR, filename), workflow_text
                                 )
-                                return response + dashboard_updates
 
-                            ensure_directory(WORKFLOW_DIR)
-                            with open(os.path.join(WORKFLOW_DIR, filename), "w", encoding="utf-8") as fh:
-                                json.dump(updated_workflow, fh, indent=2)
-
-                            final_placeholders: Dict[str, Any] = {}
-                            if isinstance(existing_placeholders_map, dict):
-                                for key, value in existing_placeholders_map.items():
-                                    if key in active_placeholders:
-                                        final_placeholders[key] = value
-                            for key, value in new_placeholders_map.items():
-                                final_placeholders[key] = value
-
-                            final_field_map: Dict[str, Any] = {}
-                            existing_field_map_lookup = existing_field_map if isinstance(existing_field_map, dict) else {}
-
-                            for idx, field in enumerate(fields):
-                                order_value = normalize_field_order(field.get("order"), idx + 1)
-                                node_id = field.get("node_id")
-                                input_name = field.get("input_name")
-                                value_type = field.get("type", "str")
-                                text_value = field.get("text_value", "")
-                                placeholder_name = field.get("placeholder", "")
-                                new_key = workflow_field_key(node_id, input_name, order_value)
-
-                                if new_key in new_field_map:
-                                    value_to_store = new_field_map[new_key]
-                                else:
-                                    _, existing_value = find_field_value(
-                                        existing_field_map_lookup, node_id, input_name
-                                    )
-                                    if existing_value is not None:
-                                        value_to_store = existing_value
-                                    elif placeholder_name:
-                                        value_to_store = final_placeholders.get(placeholder_name)
-                                    else:
-                                        typed_value, _ = convert_string_to_type(str(text_value), value_type)
-                                        value_to_store = typed_value
+                                final_placeholders = merge_active_placeholders(
+                                    existing_placeholders_map, new_placeholders_map, active_placeholders
+                                )
 
-                                final_field_map[new_key] = value_to_store
+                                final_field_map = resolve_final_field_map(
+                                    fields, new_field_map, existing_field_map, final_placeholders
+                                )
 
-                            save_workflow_settings_full(filename, final_placeholders, final_field_map)
+                                await asyncio.to_thread(
+                                    save_workflow_settings_full, filename, final_placeholders, final_field_map
+                                )
 
-                            refreshed_fields, _ = parse_workflow_for_configuration(filename)
+                            # Rebuild rows from what was just written instead of re-reading both files.
+                            refreshed_fields = await asyncio.to_thread(
+                                build_configuration_fields, updated_workflow, final_placeholders, final_field_map
+                            )
                             try:
                                 gr.Info(f"Saved {filename}")
                             except Exception:
@@ -3073,60 +3392,30 @@ def build_interface() -> gr.Blocks:
                             response = _build_config_response(
                                 filename, refreshed_fields, f"✅ Saved `{filename}`."
                             )
-                            dashboard_updates = _refresh_placeholder_dashboard(
-                                dashboard_payload.get("filename")
+                            # Only the saved workflow's placeholders can have changed; a dashboard
+                            # showing another workflow (or nothing) is left as is.
+                            dashboard_filename = dashboard_payload.get("filename")
+                            if dashboard_filename != filename:
+                                return response + list(_UNCHANGED_PLACEHOLDER_DASHBOARD)
+                            # May fetch object_info from ComfyUI, so keep it off the event loop too.
+                            dashboard_updates = await asyncio.to_thread(
+                                _refresh_placeholder_dashboard, dashboard_filename
                             )
                             return response + dashboard_updates
 
-                        def make_order_change_handler(index: int):
-                            def _handler(new_value: Any, state: Dict[str, Any]):
-                                fields = state.get("fields", []) if isinstance(state, dict) else []
-                                fields = update_field_order(fields, index, new_value)
-                                payload = {
-                                    "filename": state.get("filename") if isinstance(state, dict) else None,
-                                    "fields": fields,
-                                }
-                                return payload
-
-                            return _handler
-
-                        def make_value_change_handler(index: int):
-                            def _handler(new_value: str, state: Dict[str, Any]):
-                                fields = state.get("fields", []) if isinstance(state, dict) else []
-                                fields = update_field_value(fields, index, new_value)
-                                payload = {
-                                    "filename": state.get("filename") if isinstance(state, dict) else None,
-                                    "fields": fields,
-                                }
-                                return payload
-
-                            return _handler
-
-                        def make_placeholder_change_handler(index: int):
-                            def _handler(selection: str, state: Dict[str, Any]):
-                                fields = state.get("fields", []) if isinstance(state, dict) else []
-                                fields, value, enable_editing = update_field_placeholder(fields, index, selection)
-                                payload = {
-                                    "filename": state.get("filename") if isinstance(state, dict) else None,
-                                    "fields": fields,
-                                }
-                                return payload, gr.update(value=value, interactive=enable_editing, visible=True)
-
-                            return _handler
-
                         for idx in range(MAX_WORKFLOW_FIELDS):
                             config_order_inputs[idx].change(
-                                make_order_change_handler(idx),
+                                functools.partial(config_order_change_handler, idx),
                                 inputs=[config_order_inputs[idx], workflow_config_state],
                                 outputs=workflow_config_state,
                             )
                             config_values[idx].change(
-                                make_value_change_handler(idx),
+                                functools.partial(config_value_change_handler, idx),
                                 inputs=[config_values[idx], workflow_config_state],
                                 outputs=workflow_config_state,
                             )
                             config_placeholders[idx].change(
-                                make_placeholder_change_handler(idx),
+                                functools.partial(config_placeholder_change_handler, idx),
                                 inputs=[config_placeholders[idx], workflow_config_state],
                                 outputs=[workflow_config_state, config_values[idx]],
                             )
@@ -3147,7 +3436,7 @@ def build_interface() -> gr.Blocks:
                             restore_workflow_configuration,
                             inputs=workflow_config_state,
                             outputs=[workflow_config_state, workflow_config_status, *config_component_outputs],
-                            js="(state) => ({state, confirmed: confirm('Restore original workflow? This overwrites current edits.')})",
+                            js=RESTORE_WORKFLOW_CONFIRM_JS,
                         )
 
                         workflow_config_save_btn.click(
@@ -3161,6 +3450,7 @@ def build_interface() -> gr.Blocks:
                                 placeholder_status_md,
                                 *placeholder_component_outputs,
                             ],
+                            concurrency_limit=EVENT_CONCURRENCY_LIMIT,
                         )
 
                         placeholder_add_button.click(
@@ -3205,7 +3495,7 @@ def build_interface() -> gr.Blocks:
                                 placeholder_status_md,
                                 *placeholder_component_outputs,
                             ],
-                            js="(name, state, flag, dashboard) => [name, state, confirm(`Delete placeholder '${name}'?`), dashboard]",
+                            js=DELETE_PLACEHOLDER_CONFIRM_JS,
                         )
 
                     with gr.Accordion("Workflow Editor", open=True):
@@ -3256,7 +3546,15 @@ def build_interface() -> gr.Blocks:
                         workflow_info.value = initial_info
                         workflow_editor.value = initial_content
 
-                        def handle_upload(
+                        # Output layout for upload/delete: fixed leading outputs, the config rows, then the
+                        # dashboard (state, status, rows). Sized once so responses fill a preallocated list.
+                        dashboard_output_count = 2 + len(placeholder_component_outputs)
+                        upload_dashboard_offset = 10 + len(config_component_outputs)
+                        upload_output_count = upload_dashboard_offset + dashboard_output_count
+                        delete_dashboard_offset = 9 + len(config_component_outputs)
+                        delete_output_count = delete_dashboard_offset + dashboard_output_count
+
+                        async def handle_upload(
                             file_data,
                             current_editor_selection,
                             current_dashboard_selection,
@@ -3264,20 +3562,18 @@ def build_interface() -> gr.Blocks:
                             current_config_state,
                             current_placeholder_state,
                         ):
-                            existing_state = current_config_state if isinstance(current_config_state, dict) else {
-                                "filename": active_workflow_name,
-                                "fields": initial_config_fields.copy(),
-                            }
-                            existing_fields = existing_state.get("fields", [])
-                            existing_filename = existing_state.get("filename")
+                            # Only fall back to the startup workflow when there is no config state; its
+                            # rows are never edited in place, so they can be passed on without copying.
+                            if isinstance(current_config_state, dict):
+                                existing_fields = current_config_state.get("fields", [])
+                                existing_filename = current_config_state.get("filename")
+                            else:
+                                existing_fields = initial_config_fields
+                                existing_filename = active_workflow_name
 
-                            placeholder_dashboard_payload = (
-                                current_placeholder_state
-                                if isinstance(current_placeholder_state, dict)
-                                else {"filename": None, "fields": []}
-                            )
+                            placeholder_dashboard_payload = _coerce_state(current_placeholder_state)
 
-                            def compose_response(
+                            async def compose_response(
                                 message: str,
                                 file_update,
                                 editor_dropdown_update,
@@ -3288,8 +3584,11 @@ def build_interface() -> gr.Blocks:
                                 config_message: str,
                                 config_filename: Optional[str],
                                 config_fields: List[Dict[str, Any]],
+                                files: Optional[List[str]] = None,
+                                changed_filename: Optional[str] = None,
                             ):
-                                files_current = get_workflow_files()
+                                # Callers that already listed the directory pass that list through.
+                                files_current = files if files is not None else await asyncio.to_thread(get_workflow_files)
                                 if config_filename and config_filename not in files_current and files_current:
                                     config_filename_value = files_current[0]
                                 else:
@@ -3298,10 +3597,18 @@ def build_interface() -> gr.Blocks:
                                 dashboard_target = getattr(dashboard_dropdown_update, "value", None)
                                 if dashboard_target is None and isinstance(dashboard_dropdown_update, dict):
                                     dashboard_target = dashboard_dropdown_update.get("value")
+                                previous_dashboard_target = placeholder_dashboard_payload.get("filename")
                                 if dashboard_target is None:
-                                    dashboard_target = placeholder_dashboard_payload.get("filename")
-                                placeholder_updates = _refresh_placeholder_dashboard(dashboard_target)
-                                return (
+                                    dashboard_target = previous_dashboard_target
+                                # Rebuild the dashboard only if it switches workflow or its workflow was rewritten.
+                                if dashboard_target == previous_dashboard_target and dashboard_target != changed_filename:
+                                    placeholder_updates = _UNCHANGED_PLACEHOLDER_DASHBOARD
+                                else:
+                                    placeholder_updates = await asyncio.to_thread(
+                                        _refresh_placeholder_dashboard, dashboard_target
+                                    )
+                                out: List[Any] = [None] * upload_output_count
+                                out[:10] = (
                                     message,
                                     file_update,
                                     editor_dropdown_update,
@@ -3312,12 +3619,13 @@ def build_interface() -> gr.Blocks:
                                     config_result[0],
                                     config_result[1],
                                     gr.update(choices=files_current, value=config_filename_value),
-                                    *config_result[2:],
-                                    *placeholder_updates,
                                 )
+                                out[10:upload_dashboard_offset] = config_result[2:]
+                                out[upload_dashboard_offset:] = placeholder_updates
+                                return tuple(out)
 
                             if file_data is None:
-                                return compose_response(
+                                return await compose_response(
                                     "⚠️ Please select a workflow JSON file.",
                                     gr.update(),
                                     gr.update(),
@@ -3332,7 +3640,7 @@ def build_interface() -> gr.Blocks:
 
                             filename = os.path.basename(file_data.name)
                             if not filename.lower().endswith(".json"):
-                                return compose_response(
+                                return await compose_response(
                                     "⚠️ Workflow files must be JSON.",
                                     gr.update(value=None),
                                     gr.update(),
@@ -3345,12 +3653,12 @@ def build_interface() -> gr.Blocks:
                                     existing_fields,
                                 )
 
+                            # Blocking disk work below goes through asyncio.to_thread so other sessions keep running.
                             try:
-                                with open(file_data.name, "r", encoding="utf-8") as fh:
-                                    content = fh.read()
-                                json.loads(content)
+                                content = await asyncio.to_thread(read_text_file, file_data.name)
+                                uploaded_workflow = await asyncio.to_thread(json_loads, content)
                             except (OSError, json.JSONDecodeError) as exc:
-                                return compose_response(
+                                return await compose_response(
                                     f"❌ Failed to process upload: {exc}",
                                     gr.update(value=None),
                                     gr.update(),
@@ -3363,43 +3671,59 @@ def build_interface() -> gr.Blocks:
                                     existing_fields,
                                 )
 
-                            ensure_directory(WORKFLOW_DIR)
-                            target_path = os.path.join(WORKFLOW_DIR, filename)
-                            try:
-                                with open(target_path, "w", encoding="utf-8") as out:
-                                    out.write(content)
-                            except OSError as exc:
-                                return compose_response(
-                                    f"❌ Could not save workflow: {exc}",
-                                    gr.update(value=None),
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    f"❌ Could not save workflow: {exc}",
-                                    existing_filename,
-                                    existing_fields,
-                                )
+                            async with workflow_lock(filename):
+                                target_path = os.path.join(WORKFLOW_DIR, filename)
+                                try:
+                                    await asyncio.to_thread(ensure_directory, WORKFLOW_DIR)
+                                    await asyncio.to_thread(write_text_atomic, target_path, content)
+                                    clear_workflow_files_cache()
+                                except OSError as exc:
+                                    return await compose_response(
+                                        f"❌ Could not save workflow: {exc}",
+                                        gr.update(value=None),
+                                        gr.update(),
+                                        gr.update(),
+                                        gr.update(),
+                                        gr.update(),
+                                        gr.update(),
+                                        f"❌ Could not save workflow: {exc}",
+                                        existing_filename,
+                                        existing_fields,
+                                    )
 
-                            files = get_workflow_files()
+                            files = await asyncio.to_thread(get_workflow_files)
                             new_editor_value = filename if filename in files else (files[0] if files else None)
                             new_dashboard_value = current_dashboard_selection if current_dashboard_selection in files else new_editor_value
                             new_delete_value = current_delete_selection if current_delete_selection in files else new_editor_value
 
-                            info_text, editor_content = load_workflow(new_editor_value) if new_editor_value else ("No workflow selected", "")
-
-                            config_fields, _ = parse_workflow_for_configuration(new_editor_value) if new_editor_value else ([], {})
+                            async with workflow_lock(new_editor_value):
+                                if new_editor_value == filename:
+                                    # The file was just written from memory; reuse it instead of reading it back.
+                                    info_text = await asyncio.to_thread(summarize_workflow_placeholders, content)
+                                    editor_content = content
+                                    await asyncio.to_thread(ensure_workflow_original, filename, content)
+                                    config_workflow_data = uploaded_workflow
+                                    config_fields = await asyncio.to_thread(
+                                        build_configuration_fields,
+                                        uploaded_workflow,
+                                        *await asyncio.to_thread(load_workflow_settings_full, filename),
+                                    )
+                                elif new_editor_value:
+                                    info_text, editor_content = await asyncio.to_thread(load_workflow, new_editor_value)
+                                    config_fields, config_workflow_data = await asyncio.to_thread(
+                                        parse_workflow_for_configuration, new_editor_value
+                                    )
+                                else:
+                                    info_text, editor_content = "No workflow selected", ""
+                                    config_fields, config_workflow_data = [], {}
 
-                            settings_message = ""
-                            if new_editor_value:
-                                try:
-                                    workflow_data_for_settings, _ = load_workflow_file(new_editor_value)
-                                except FileNotFoundError:
-                                    workflow_data_for_settings = None
-                                if workflow_data_for_settings is not None:
+                                settings_message = ""
+                                if new_editor_value:
+                                    workflow_data_for_settings = editable_workflow_copy(config_workflow_data)
                                     fields_for_save = [dict(item) for item in config_fields]
-                                    existing_placeholders_map, existing_field_map = load_workflow_settings_full(new_editor_value)
+                                    existing_placeholders_map, existing_field_map = await asyncio.to_thread(
+                                        load_workflow_settings_full, new_editor_value
+                                    )
                                     (
                                         errors_settings,
                                         new_placeholder_settings,
@@ -3414,55 +3738,37 @@ def build_interface() -> gr.Blocks:
                                     if errors_settings:
                                         settings_message = " Settings initialization failed: " + " | ".join(errors_settings)
                                     else:
-                                        final_placeholder_settings: Dict[str, Any] = {}
-                                        if isinstance(existing_placeholders_map, dict):
-                                            for key, value in existing_placeholders_map.items():
-                                                if key in active_placeholder_settings:
-                                                    final_placeholder_settings[key] = value
-                                        for key, value in new_placeholder_settings.items():
-                                            final_placeholder_settings[key] = value
-
-                                        existing_field_map_lookup = existing_field_map if isinstance(existing_field_map, dict) else {}
-                                        final_field_map: Dict[str, Any] = {}
-                                        for idx, field in enumerate(config_fields):
-                                            order_value = normalize_field_order(field.get("order"), idx + 1)
-                                            node_id = field.get("node_id")
-                                            input_name = field.get("input_name")
-                                            value_type = field.get("type", "str")
-                                            text_value = field.get("text_value", "")
-                                            placeholder_name = field.get("placeholder", "")
-                                            new_key = workflow_field_key(node_id, input_name, order_value)
-
-                                            if new_key in new_field_map:
-                                                value_to_store = new_field_map[new_key]
-                                            else:
-                                                _, existing_value = find_field_value(
-                                                    existing_field_map_lookup, node_id, input_name
-                                                )
-                                                if existing_value is not None:
-                                                    value_to_store = existing_value
-                                                elif placeholder_name:
-                                                    value_to_store = final_placeholder_settings.get(placeholder_name)
-                                                else:
-                                                    typed_value, _ = convert_string_to_type(
-                                                        str(text_value), value_type
-                                                    )
-                                                    value_to_store = typed_value
-
-                                            final_field_map[new_key] = value_to_store
-
-                                        save_workflow_settings_full(
+                                        final_placeholder_settings = merge_active_placeholders(
+                                            existing_placeholders_map,
+                                            new_placeholder_settings,
+                                            active_placeholder_settings,
+                                        )
+
+                                        final_field_map = resolve_final_field_map(
+                                            config_fields,
+                                            new_field_map,
+                                            existing_field_map,
+                                            final_placeholder_settings,
+                                        )
+
+                                        await asyncio.to_thread(
+                                            save_workflow_settings_full,
                                             new_editor_value,
                                             final_placeholder_settings,
                                             final_field_map,
                                         )
-                                        config_fields, _ = parse_workflow_for_configuration(new_editor_value)
+                                        config_fields = await asyncio.to_thread(
+                                            build_configuration_fields,
+                                            config_workflow_data,
+                                            final_placeholder_settings,
+                                            final_field_map,
+                                        )
 
                             upload_message = f"✅ Uploaded `{filename}`."
                             if settings_message:
                                 upload_message += settings_message
 
-                            return compose_response(
+                            return await compose_response(
                                 upload_message,
                                 gr.update(value=None),
                                 gr.update(choices=files, value=new_editor_value),
@@ -3473,6 +3779,8 @@ def build_interface() -> gr.Blocks:
                                 f"✅ Uploaded `{filename}`.",
                                 new_editor_value,
                                 config_fields,
+                                files=files,
+                                changed_filename=filename,
                             )
 
                         workflow_upload.upload(
@@ -3501,29 +3809,37 @@ def build_interface() -> gr.Blocks:
                                 placeholder_status_md,
                                 *placeholder_component_outputs,
                             ],
+                            concurrency_limit=EVENT_CONCURRENCY_LIMIT,
+                        )
+
+                        # Cancelling in the browser confirm still reaches the server with no filename;
+                        # answer with the status messages alone instead of re-rendering anything.
+                        # Only the value-less no-op updates are shared: Gradio pops "value" out of
+                        # returned update dicts, so the status update is built per call.
+                        delete_cancelled_head = tuple(gr.update() for _ in range(6))
+                        delete_cancelled_tail = (
+                            *(gr.update() for _ in range(1 + len(config_component_outputs))),
+                            *_UNCHANGED_PLACEHOLDER_DASHBOARD,
                         )
 
-                        def handle_delete(
+                        async def handle_delete(
                             filename,
                             current_editor_selection,
                             current_dashboard_selection,
                             current_config_state,
                             current_placeholder_state,
                         ):
-                            existing_state = current_config_state if isinstance(current_config_state, dict) else {
-                                "filename": active_workflow_name,
-                                "fields": initial_config_fields.copy(),
-                            }
-                            existing_fields = existing_state.get("fields", [])
-                            existing_filename = existing_state.get("filename")
+                            if not filename:
+                                return (
+                                    "Deletion cancelled.",
+                                    *delete_cancelled_head,
+                                    gr.update(value="Deletion cancelled."),
+                                    *delete_cancelled_tail,
+                                )
 
-                            placeholder_dashboard_payload = (
-                                current_placeholder_state
-                                if isinstance(current_placeholder_state, dict)
-                                else {"filename": None, "fields": []}
-                            )
+                            placeholder_dashboard_payload = _coerce_state(current_placeholder_state)
 
-                            def compose_response(
+                            async def compose_response(
                                 message: str,
                                 editor_dropdown_update,
                                 dashboard_dropdown_update,
@@ -3533,8 +3849,11 @@ def build_interface() -> gr.Blocks:
                                 config_message: str,
                                 config_filename: Optional[str],
                                 config_fields: List[Dict[str, Any]],
+                                files: Optional[List[str]] = None,
+                                changed_filename: Optional[str] = None,
                             ):
-                                files_current = get_workflow_files()
+                                # Callers that already listed the directory pass that list through.
+                                files_current = files if files is not None else await asyncio.to_thread(get_workflow_files)
                                 if config_filename and config_filename not in files_current and files_current:
                                     config_filename_value = files_current[0]
                                 else:
@@ -3543,10 +3862,18 @@ def build_interface() -> gr.Blocks:
                                 dashboard_target = getattr(dashboard_dropdown_update, "value", None)
                                 if dashboard_target is None and isinstance(dashboard_dropdown_update, dict):
                                     dashboard_target = dashboard_dropdown_update.get("value")
+                                previous_dashboard_target = placeholder_dashboard_payload.get("filename")
                                 if dashboard_target is None:
-                                    dashboard_target = placeholder_dashboard_payload.get("filename")
-                                placeholder_updates = _refresh_placeholder_dashboard(dashboard_target)
-                                return (
+                                    dashboard_target = previous_dashboard_target
+                                # Rebuild the dashboard only if it switches workflow or its workflow was rewritten.
+                                if dashboard_target == previous_dashboard_target and dashboard_target != changed_filename:
+                                    placeholder_updates = _UNCHANGED_PLACEHOLDER_DASHBOARD
+                                else:
+                                    placeholder_updates = await asyncio.to_thread(
+                                        _refresh_placeholder_dashboard, dashboard_target
+                                    )
+                                out: List[Any] = [None] * delete_output_count
+                                out[:9] = (
                                     message,
                                     editor_dropdown_update,
                                     dashboard_dropdown_update,
@@ -3556,24 +3883,14 @@ def build_interface() -> gr.Blocks:
                                     config_result[0],
                                     config_result[1],
                                     gr.update(choices=files_current, value=config_filename_value),
-                                    *config_result[2:],
-                                    *placeholder_updates,
-                                )
-
-                            if not filename:
-                                return compose_response(
-                                    "Deletion cancelled.",
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    gr.update(),
-                                    "Deletion cancelled.",
-                                    existing_filename,
-                                    existing_fields,
                                 )
+                                out[9:delete_dashboard_offset] = config_result[2:]
+                                out[delete_dashboard_offset:] = placeholder_updates
+                                return tuple(out)
 
-                            removed_paths = remove_associated_workflow_files(filename)
+                            async with workflow_lock(filename):
+                                removed_paths = await asyncio.to_thread(remove_associated_workflow_files, filename)
+                            clear_workflow_files_cache()
                             if not removed_paths:
                                 message = f"⚠️ `{filename}` not found."
                             else:
@@ -3581,16 +3898,21 @@ def build_interface() -> gr.Blocks:
                                 if len(removed_paths) > 1:
                                     message += f" (and {len(removed_paths) - 1} associated files)."
 
-                            files = get_workflow_files()
+                            files = await asyncio.to_thread(get_workflow_files)
                             new_editor_value = current_editor_selection if current_editor_selection in files else (files[0] if files else None)
                             new_dashboard_value = current_dashboard_selection if current_dashboard_selection in files else new_editor_value
                             new_delete_value = new_editor_value if new_editor_value in files else None
 
-                            info_text, editor_content = load_workflow(new_editor_value) if new_editor_value else ("No workflow selected", "")
-
-                            config_fields, _ = parse_workflow_for_configuration(new_editor_value) if new_editor_value else ([], {})
+                            if new_editor_value:
+                                info_text, editor_content = await asyncio.to_thread(load_workflow, new_editor_value)
+                                config_fields, _ = await asyncio.to_thread(
+                                    parse_workflow_for_configuration, new_editor_value
+                                )
+                            else:
+                                info_text, editor_content = "No workflow selected", ""
+                                config_fields = []
 
-                            return compose_response(
+                            return await compose_response(
                                 message,
                                 gr.update(choices=files, value=new_editor_value),
                                 gr.update(choices=files, value=new_dashboard_value),
@@ -3600,6 +3922,8 @@ def build_interface() -> gr.Blocks:
                                 message,
                                 new_editor_value,
                                 config_fields,
+                                files=files,
+                                changed_filename=filename,
                             )
 
                         delete_workflow_button.click(
@@ -3626,7 +3950,8 @@ def build_interface() -> gr.Blocks:
                                 placeholder_status_md,
                                 *placeholder_component_outputs,
                             ],
-                            js="(selected, editorValue, dashboardValue, configState, dashboardForm) => { if (!selected) { alert('Select a workflow to delete.'); return [null, editorValue, dashboardValue, configState, dashboardForm]; } const ok = confirm(`Delete workflow '${selected}'? This will remove associated files.`); return ok ? [selected, editorValue, dashboardValue, configState, dashboardForm] : [null, editorValue, dashboardValue, configState, dashboardForm]; }",
+                            js=DELETE_WORKFLOW_CONFIRM_JS,
+                            concurrency_limit=EVENT_CONCURRENCY_LIMIT,
                         )
 
                 with gr.Accordion("Style management", open=False):
@@ -3646,11 +3971,8 @@ def build_interface() -> gr.Blocks:
                     style_manage_status = gr.Markdown()
                     style_manage_preview = gr.Markdown()
 
-                    def refresh_styles_table() -> List[List[str]]:
-                        return styles_as_table()
-
                     add_btn.click(
-                        add_style,
+                        add_style_with_table,
                         inputs=[style_name_input, pre_input, post_input],
                         outputs=[
                             style_manage_status,
@@ -3658,15 +3980,12 @@ def build_interface() -> gr.Blocks:
                             style_preview,
                             style_dropdown,
                             gen_style_dropdown,
+                            styles_table,
                         ],
-                    ).then(
-                        refresh_styles_table,
-                        inputs=None,
-                        outputs=styles_table,
                     )
 
                     update_btn.click(
-                        update_style,
+                        update_style_with_table,
                         inputs=[style_name_input, pre_input, post_input],
                         outputs=[
                             style_manage_status,
@@ -3674,15 +3993,12 @@ def build_interface() -> gr.Blocks:
                             style_preview,
                             style_dropdown,
                             gen_style_dropdown,
+                            styles_table,
                         ],
-                    ).then(
-                        refresh_styles_table,
-                        inputs=None,
-                        outputs=styles_table,
                     )
 
                     delete_btn.click(
-                        delete_style,
+                        delete_style_with_table,
                         inputs=style_name_input,
                         outputs=[
                             style_manage_status,
@@ -3690,11 +4006,8 @@ def build_interface() -> gr.Blocks:
                             style_preview,
                             style_dropdown,
                             gen_style_dropdown,
+                            styles_table,
                         ],
-                    ).then(
-                        refresh_styles_table,
-                        inputs=None,
-                        outputs=styles_table,
                     )
 
                     style_name_input.change(
@@ -9,8 +9,14 @@ import time
 import os
 import signal
 import logging
+import queue
+import selectors
 from threading import Thread
 
+READ_CHUNK_SIZE = 64 * 1024
+# Windows can only select() on sockets, so pipes there are drained by reader threads instead
+SELECT_ON_PIPES = os.name != "nt"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -19,70 +25,141 @@ class ProcessManager:
         self.flask_process = None
         self.gradio_process = None
         self.running = True
+        # Both child pipes are multiplexed from the main thread instead of one reader thread each
+        self.selector = selectors.DefaultSelector() if SELECT_ON_PIPES else None
+        self.output_queue = queue.Queue()
+        self.open_streams = 0
+        self.processes = {}
+        # Each stream's unfinished last line, held back so the two children never share a line
+        self.pending_tail = {}
+
+    def _spawn(self, script, tag):
+        """Start a child process and register its non-blocking stdout with the selector"""
+        process = subprocess.Popen(
+            [sys.executable, script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=READ_CHUNK_SIZE,
+        )
+        self.pending_tail[tag] = b""
+        self.open_streams += 1
+        self.processes[tag] = process
+        if self.selector is not None:
+            os.set_blocking(process.stdout.fileno(), False)
+            self.selector.register(process.stdout, selectors.EVENT_READ, data=tag)
+        else:
+            Thread(target=self._read_pipe, args=(process.stdout.fileno(), tag), daemon=True).start()
+        return process
+
+    def _read_pipe(self, fd, tag):
+        """Fallback reader: forward raw chunks to the main loop until EOF"""
+        while True:
+            try:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+            except OSError:
+                chunk = b""
+            self.output_queue.put((tag, chunk))
+            if not chunk:
+                return
+
+    def _ready_chunks(self, timeout):
+        """Yield (tag, chunk) pairs that are ready within `timeout`; b"" marks EOF"""
+        if self.selector is None:
+            try:
+                yield self.output_queue.get(timeout=timeout)
+                while True:
+                    yield self.output_queue.get_nowait()
+            except queue.Empty:
+                return
+        for key, _ in self.selector.select(timeout=timeout):
+            try:
+                # Raw bulk read of whatever is in the pipe; no decoding or line splitting
+                chunk = os.read(key.fd, READ_CHUNK_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                self.selector.unregister(key.fileobj)
+            yield key.data, chunk
 
     def start_flask(self):
         """Start Flask API server"""
         try:
             logging.info("Starting Flask API server...")
-            self.flask_process = subprocess.Popen(
-                [sys.executable, "app.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Stream Flask output
-            for line in iter(self.flask_process.stdout.readline, ''):
-                if not self.running:
-                    break
-                print(f"[FLASK] {line.rstrip()}")
-                
+            self.flask_process = self._spawn("app.py", b"[FLASK] ")
         except Exception as e:
             logging.error(f"Error starting Flask: {e}")
 
     def start_gradio(self):
         """Start Gradio web interface"""
         try:
-            # Wait a moment for Flask to start
-            time.sleep(2)
             logging.info("Starting Gradio web interface...")
-
-            self.gradio_process = subprocess.Popen(
-                [sys.executable, "gradio_app.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
-
-            # Stream Gradio output
-            for line in iter(self.gradio_process.stdout.readline, ''):
-                if not self.running:
-                    break
-                print(f"[GRADIO] {line.rstrip()}")
-
+            self.gradio_process = self._spawn("gradio_app.py", b"[GRADIO] ")
         except Exception as e:
             logging.error(f"Error starting Gradio: {e}")
 
+    def pump_output(self, timeout):
+        """Forward whatever the children have written, tagging the start of each line.
+
+        Returns the tags of streams that reached EOF during this call.
+        """
+        if not self.open_streams:
+            time.sleep(1.0 if timeout is None else timeout)
+            return []
+        closed = []
+        out = sys.stdout.buffer
+        for tag, chunk in self._ready_chunks(timeout):
+            if not chunk:
+                # EOF: flush an unfinished last line; this stream is done
+                self.open_streams -= 1
+                closed.append(tag)
+                if self.pending_tail[tag]:
+                    out.write(tag + self.pending_tail[tag] + b"\n")
+                    self.pending_tail[tag] = b""
+                continue
+            data = self.pending_tail[tag] + chunk if self.pending_tail[tag] else chunk
+            # Forward only complete lines, tagging each one; the rest waits for the next chunk
+            end = data.rfind(b"\n") + 1
+            self.pending_tail[tag] = data[end:]
+            if end:
+                out.write(tag + data[:end - 1].replace(b"\n", b"\n" + tag) + b"\n")
+        out.flush()
+        return closed
+
     def start_both(self):
-        """Start both services in separate threads"""
-        flask_thread = Thread(target=self.start_flask, daemon=True)
-        gradio_thread = Thread(target=self.start_gradio, daemon=True)
+        """Start both services and stream their output from a single loop"""
+        self.start_flask()
+        # Give Flask a moment to start before launching Gradio
+        gradio_start_at = time.monotonic() + 2
 
-        flask_thread.start()
-        gradio_thread.start()
-        
         logging.info("🚀 Both services starting...")
         logging.info("📡 Flask API will be available at: http://localhost:4000")  
         logging.info("🌐 Gradio UI will be available using the configured port (default 8501)")
         logging.info("💡 Press Ctrl+C to stop both services")
         
+        gradio_pending = True
         try:
-            # Keep main thread alive
             while self.running:
-                time.sleep(1)
-                
+                if gradio_pending and time.monotonic() >= gradio_start_at:
+                    self.start_gradio()
+                    gradio_pending = False
+
+                # A child exiting closes its pipe, which wakes the select immediately, so once
+                # both are started there is no need to wake up periodically just to poll()
+                if gradio_pending:
+                    timeout = max(0.0, gradio_start_at - time.monotonic())
+                elif self.selector is not None:
+                    timeout = None
+                else:
+                    timeout = 1.0
+
+                closed = self.pump_output(timeout)
+                for tag in closed:
+                    try:
+                        # The pipe closes just before the exit status is available
+                        self.processes[tag].wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        pass
+
                 # Check if processes are still running
                 if self.flask_process and self.flask_process.poll() is not None:
                     logging.error("Flask process died unexpectedly")
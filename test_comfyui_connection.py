@@ -6,17 +6,35 @@ This script helps diagnose ComfyUI connection issues.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import functools
 import json
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-def test_basic_connection(url):
+def create_session():
+    """Create a keep-alive session so repeated probes reuse connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@functools.lru_cache(maxsize=1)
+def load_config():
+    """Read config.json once; call load_config.cache_clear() to pick up changes"""
+    with open("config.json", 'r') as f:
+        return json.load(f)
+
+def test_basic_connection(url, session=None):
     """Test basic HTTP connection"""
     print(f"🔍 Testing basic connection to {url}")
+    http = session or requests
     
     try:
-        response = requests.get(url, timeout=10)
+        response = http.get(url, timeout=10)
         print(f"✅ Basic connection successful - Status: {response.status_code}")
         return True
     except requests.exceptions.ConnectException as e:
@@ -29,21 +47,32 @@ def test_basic_connection(url):
         print(f"❌ Request error: {e}")
         return False
 
-def test_port_open(host, port):
-    """Test if port is open"""
-    print(f"🔍 Testing if port {port} is open on {host}")
-    
+def check_port(host, port):
+    """Return (is_open, error) for a TCP port without printing"""
     try:
         with socket.create_connection((host, port), timeout=5):
-            print(f"✅ Port {port} is open")
-            return True
+            return True, None
     except socket.error as e:
-        print(f"❌ Port {port} is not accessible: {e}")
-        return False
+        return False, e
 
-def test_comfyui_endpoints(base_url):
+def report_port(host, port, is_open, error):
+    """Print the outcome of a port check"""
+    print(f"🔍 Testing if port {port} is open on {host}")
+    if is_open:
+        print(f"✅ Port {port} is open")
+    else:
+        print(f"❌ Port {port} is not accessible: {error}")
+
+def test_port_open(host, port):
+    """Test if port is open"""
+    is_open, error = check_port(host, port)
+    report_port(host, port, is_open, error)
+    return is_open
+
+def test_comfyui_endpoints(base_url, session=None):
     """Test specific ComfyUI endpoints"""
     print(f"🔍 Testing ComfyUI-specific endpoints at {base_url}")
+    http = session or requests
     
     endpoints_to_test = [
         "/system_stats",
@@ -55,10 +84,16 @@ def test_comfyui_endpoints(base_url):
     
     results = {}
     
-    for endpoint in endpoints_to_test:
-        url = base_url + endpoint
+    # The probes are independent, so run them together and report in the listed order
+    with ThreadPoolExecutor(max_workers=len(endpoints_to_test)) as executor:
+        futures = [
+            (endpoint, executor.submit(http.get, base_url + endpoint, timeout=10))
+            for endpoint in endpoints_to_test
+        ]
+    
+    for endpoint, future in futures:
         try:
-            response = requests.get(url, timeout=10)
+            response = future.result()
             if response.status_code == 200:
                 print(f"✅ {endpoint}: OK ({response.status_code})")
                 results[endpoint] = True
@@ -71,13 +106,12 @@ def test_comfyui_endpoints(base_url):
     
     return results
 
-def test_from_config():
+def test_from_config(session=None):
     """Test connection using config.json settings"""
     print("🔍 Testing connection using config.json settings")
     
     try:
-        with open("config.json", 'r') as f:
-            config = json.load(f)
+        config = load_config()
         
         comfyui_url = config.get("comfyui_url", "http://127.0.0.1:8188")
         print(f"📋 Config ComfyUI URL: {comfyui_url}")
@@ -93,11 +127,11 @@ def test_from_config():
         port_open = test_port_open(host, port)
         
         # Test basic connection
-        basic_connection = test_basic_connection(comfyui_url)
+        basic_connection = test_basic_connection(comfyui_url, session)
         
         # Test ComfyUI endpoints if basic connection works
         if basic_connection:
-            endpoint_results = test_comfyui_endpoints(comfyui_url)
+            endpoint_results = test_comfyui_endpoints(comfyui_url, session)
         else:
             endpoint_results = {}
         
@@ -151,18 +185,24 @@ def run_diagnostics():
     print("🚀 ComfyUI Connection Diagnostics")
     print("="*60)
     
+    # One pooled session serves every HTTP probe below
+    session = create_session()
+    
     # Test from config
-    results = test_from_config()
+    results = test_from_config(session)
     
     # Additional manual tests
     print(f"\n🔍 Additional Tests:")
     
     # Test common ComfyUI ports
     common_ports = [8188, 8080, 3000, 5000]
-    for port in common_ports:
-        if test_port_open('127.0.0.1', port):
+    with ThreadPoolExecutor(max_workers=len(common_ports)) as executor:
+        port_checks = list(executor.map(lambda port: check_port('127.0.0.1', port), common_ports))
+    for port, (is_open, error) in zip(common_ports, port_checks):
+        report_port('127.0.0.1', port, is_open, error)
+        if is_open:
             print(f"   • Found service on port {port}")
-            test_basic_connection(f"http://127.0.0.1:{port}")
+            test_basic_connection(f"http://127.0.0.1:{port}", session)
     
     # Suggest solutions
     suggest_solutions(results)